@@ -93,6 +93,10 @@ class AppExecutionConfig(BaseSettings):
         description="Maximum number of concurrent active requests per app (0 for unlimited)",
         default=0,
     )
+    CONVERSATION_NAME_GENERATION_WORKERS: PositiveInt = Field(
+        description="Maximum number of threads per process used to generate conversation names in the background",
+        default=8,
+    )
 
     HUMAN_INPUT_GLOBAL_TIMEOUT_SECONDS: PositiveInt = Field(
         description="Maximum seconds a workflow run can stay paused waiting for human input before global timeout.",
@@ -1,7 +1,7 @@
 from collections.abc import Mapping
 from typing import Any
 
-from core.app.app_config.entities import AppAdditionalFeatures
+from core.app.app_config.entities import AppAdditionalFeatures, AppConfig, EasyUIBasedAppModelConfigFrom
 from core.app.app_config.features.file_upload.manager import FileUploadConfigManager
 from core.app.app_config.features.more_like_this.manager import MoreLikeThisConfigManager
 from core.app.app_config.features.opening_statement.manager import OpeningStatementConfigManager
@@ -47,3 +47,23 @@ class BaseAppConfigManager:
         additional_features.text_to_speech = TextToSpeechConfigManager.convert(config=config_dict)
 
         return additional_features
+
+    @staticmethod
+    def _build_config[AppConfigT: AppConfig](
+        config_cls: type[AppConfigT], config_from: EasyUIBasedAppModelConfigFrom | None, /, **fields: Any
+    ) -> AppConfigT:
+        """
+        Build an app config, validating it only when it was supplied with the request
+
+        Every nested entity is built and validated by the feature converters and the
+        remaining fields are ids, enums and the source config dict, so for stored configs
+        the top-level validation only repeats that work. Configs passed in with the request
+        (``EasyUIBasedAppModelConfigFrom.ARGS``) are still validated.
+
+        :param config_cls: app config class
+        :param config_from: where the config was loaded from, ``None`` for workflow-based apps
+        :param fields: app config fields
+        """
+        if config_from == EasyUIBasedAppModelConfigFrom.ARGS:
+            return config_cls(**fields)
+        return config_cls.model_construct(**fields)
@@ -89,9 +89,7 @@ class DatasetConfigManager:
                 dataset_ids=dataset_ids,
                 retrieve_config=DatasetRetrieveConfigEntity(
                     query_variable=query_variable,
-                    retrieve_strategy=DatasetRetrieveConfigEntity.RetrieveStrategy.value_of(
-                        dataset_configs["retrieval_model"]
-                    ),
+                    retrieve_strategy=DatasetRetrieveConfigEntity.RetrieveStrategy(dataset_configs["retrieval_model"]),
                     metadata_filtering_mode=cast(
                         Literal["disabled", "automatic", "manual"],
                         dataset_configs.get("metadata_filtering_mode", "disabled"),
@@ -113,9 +111,7 @@ class DatasetConfigManager:
                 dataset_ids=dataset_ids,
                 retrieve_config=DatasetRetrieveConfigEntity(
                     query_variable=query_variable,
-                    retrieve_strategy=DatasetRetrieveConfigEntity.RetrieveStrategy.value_of(
-                        dataset_configs["retrieval_model"]
-                    ),
+                    retrieve_strategy=DatasetRetrieveConfigEntity.RetrieveStrategy(dataset_configs["retrieval_model"]),
                     top_k=int(dataset_configs.get("top_k", 4)),
                     score_threshold=float(score_threshold_val)
                     if dataset_configs.get("score_threshold_enabled", False) and score_threshold_val is not None
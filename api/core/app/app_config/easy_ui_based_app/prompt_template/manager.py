@@ -17,7 +17,7 @@ class PromptTemplateConfigManager:
         if not config.get("prompt_type"):
             raise ValueError("prompt_type is required")
 
-        prompt_type = PromptTemplateEntity.PromptType.value_of(config["prompt_type"])
+        prompt_type = PromptTemplateEntity.PromptType(config["prompt_type"])
         if prompt_type == PromptTemplateEntity.PromptType.SIMPLE:
             simple_prompt_template = config.get("pre_prompt", "")
             return PromptTemplateEntity(prompt_type=prompt_type, simple_prompt_template=simple_prompt_template)
@@ -72,19 +72,6 @@ class PromptTemplateEntity(BaseModel):
         SIMPLE = auto()
         ADVANCED = auto()
 
-        @classmethod
-        def value_of(cls, value: str):
-            """
-            Get value of given mode.
-
-            :param value: mode value
-            :return: mode
-            """
-            for mode in cls:
-                if mode.value == value:
-                    return mode
-            raise ValueError(f"invalid prompt type value {value}")
-
     prompt_type: PromptType
     simple_prompt_template: str | None = None
     advanced_chat_prompt_template: AdvancedChatPromptTemplateEntity | None = None
@@ -132,19 +119,6 @@ class DatasetRetrieveConfigEntity(BaseModel):
         SINGLE = auto()
         MULTIPLE = auto()
 
-        @classmethod
-        def value_of(cls, value: str):
-            """
-            Get value of given mode.
-
-            :param value: mode value
-            :return: mode
-            """
-            for mode in cls:
-                if mode.value == value:
-                    return mode
-            raise ValueError(f"invalid retrieve strategy value {value}")
-
     query_variable: str | None = None  # Only when app mode is completion
 
     retrieve_strategy: RetrieveStrategy
@@ -27,7 +27,9 @@ class AdvancedChatAppConfigManager(BaseAppConfigManager):
     def get_app_config(cls, app_model: App, workflow: Workflow) -> AdvancedChatAppConfig:
         features_dict = workflow.features_dict
         app_mode = AppMode.value_of(app_model.mode)
-        app_config = AdvancedChatAppConfig(
+        app_config = cls._build_config(
+            AdvancedChatAppConfig,
+            None,
             tenant_id=app_model.tenant_id,
             app_id=app_model.id,
             app_mode=app_mode,
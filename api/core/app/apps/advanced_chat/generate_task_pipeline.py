@@ -2,10 +2,10 @@ import json
 import logging
 import time
 from collections.abc import Callable, Generator, Mapping
+from concurrent.futures import Future
 from contextlib import contextmanager
 from dataclasses import dataclass
 from datetime import datetime
-from threading import Thread
 from typing import Any, Union
 
 from sqlalchemy import select, update
@@ -204,7 +204,7 @@ class AdvancedChatAppGenerateTaskPipeline(GraphRuntimeStateSupport):
         self._conversation_mode = conversation.mode
         self._message_id = message.id
         self._message_created_at = int(message.created_at.timestamp())
-        self._conversation_name_generate_thread: Thread | None = None
+        self._conversation_name_generate_future: Future[None] | None = None
         self._recorded_files: list[Mapping[str, Any]] = []
         self._workflow_run_id: str = ""
         self._draft_var_saver_factory = draft_var_saver_factory
@@ -227,7 +227,7 @@ class AdvancedChatAppGenerateTaskPipeline(GraphRuntimeStateSupport):
         Process generate task pipeline.
         :return:
         """
-        self._conversation_name_generate_thread = self._message_cycle_manager.generate_conversation_name(
+        self._conversation_name_generate_future = self._message_cycle_manager.generate_conversation_name(
             conversation_id=self._conversation_id, query=self._application_generate_entity.query
         )
 
@@ -1039,8 +1039,8 @@ class AdvancedChatAppGenerateTaskPipeline(GraphRuntimeStateSupport):
         if tts_publisher:
             tts_publisher.publish(None)
 
-        if self._conversation_name_generate_thread:
-            logger.debug("Conversation name generation running as daemon thread")
+        if self._conversation_name_generate_future:
+            logger.debug("Conversation name generation running in background")
 
     def _save_message(self, *, session: Session, graph_runtime_state: GraphRuntimeState | None = None):
         message = self._get_message(session=session)
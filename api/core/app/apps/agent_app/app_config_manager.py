@@ -58,7 +58,12 @@ class AgentAppConfigManager(BaseAppConfigManager):
         typed_config = cast(AppModelConfigDict, config_dict)
         app_mode = AppMode.value_of(app_model.mode)
 
-        app_config = AgentAppConfig(
+        # synthesized from the Agent Soul rather than read from a row, but still safe to build
+        # without re-validation: the dict is a plain str-keyed mapping and every nested entity
+        # below is built and validated by its converter
+        app_config = cls._build_config(
+            AgentAppConfig,
+            EasyUIBasedAppModelConfigFrom.APP_LATEST_CONFIG,
             tenant_id=app_model.tenant_id,
             app_id=app_model.id,
             app_mode=app_mode,
@@ -108,7 +113,7 @@ class AgentAppConfigManager(BaseAppConfigManager):
         # The Agent Soul system prompt rides the EasyUI "simple" prompt slot; the
         # agent backend is the real prompt authority, this only feeds the chat
         # pipeline's bookkeeping (token counting, persistence).
-        base["prompt_type"] = PromptTemplateEntity.PromptType.SIMPLE.value
+        base["prompt_type"] = PromptTemplateEntity.PromptType.SIMPLE
         base["pre_prompt"] = agent_soul.prompt.system_prompt or ""
         base["user_input_form"] = agent_app_variables_to_user_input_form(agent_soul.app_variables)
         return base
@@ -70,7 +70,9 @@ class AgentChatAppConfigManager(BaseAppConfigManager):
             config_dict = override_config_dict
 
         app_mode = AppMode.value_of(app_model.mode)
-        app_config = AgentChatAppConfig(
+        app_config = cls._build_config(
+            AgentChatAppConfig,
+            config_from,
             tenant_id=app_model.tenant_id,
             app_id=app_model.id,
             app_mode=app_mode,
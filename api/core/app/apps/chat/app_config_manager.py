@@ -64,7 +64,9 @@ class ChatAppConfigManager(BaseAppConfigManager):
             config_dict = override_config_dict
 
         app_mode = AppMode.value_of(app_model.mode)
-        app_config = ChatAppConfig(
+        app_config = cls._build_config(
+            ChatAppConfig,
+            config_from,
             tenant_id=app_model.tenant_id,
             app_id=app_model.id,
             app_mode=app_mode,
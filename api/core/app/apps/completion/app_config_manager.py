@@ -54,7 +54,9 @@ class CompletionAppConfigManager(BaseAppConfigManager):
             config_dict = override_config_dict
 
         app_mode = AppMode.value_of(app_model.mode)
-        app_config = CompletionAppConfig(
+        app_config = cls._build_config(
+            CompletionAppConfig,
+            config_from,
             tenant_id=app_model.tenant_id,
             app_id=app_model.id,
             app_mode=app_mode,
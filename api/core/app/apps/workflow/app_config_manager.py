@@ -22,7 +22,9 @@ class WorkflowAppConfigManager(BaseAppConfigManager):
         features_dict = workflow.features_dict
 
         app_mode = AppMode.value_of(app_model.mode)
-        app_config = WorkflowAppConfig(
+        app_config = cls._build_config(
+            WorkflowAppConfig,
+            None,
             tenant_id=app_model.tenant_id,
             app_id=app_model.id,
             app_mode=app_mode,
@@ -1,7 +1,7 @@
 import logging
 import time
 from collections.abc import Generator, Mapping, Sequence
-from threading import Thread
+from concurrent.futures import Future
 from typing import Any, cast
 
 from sqlalchemy import select
@@ -112,7 +112,7 @@ class EasyUIBasedGenerateTaskPipeline(BasedGenerateTaskPipeline[EasyUIAppGenerat
             task_state=self._task_state,
         )
 
-        self._conversation_name_generate_thread: Thread | None = None
+        self._conversation_name_generate_future: Future[None] | None = None
 
     def process(
         self,
@@ -123,7 +123,7 @@ class EasyUIBasedGenerateTaskPipeline(BasedGenerateTaskPipeline[EasyUIAppGenerat
     ):
         if self._application_generate_entity.app_config.app_mode != AppMode.COMPLETION:
             # start generate conversation name thread
-            self._conversation_name_generate_thread = self._message_cycle_manager.generate_conversation_name(
+            self._conversation_name_generate_future = self._message_cycle_manager.generate_conversation_name(
                 conversation_id=self._conversation_id, query=self._application_generate_entity.query
             )
 
@@ -360,8 +360,8 @@ class EasyUIBasedGenerateTaskPipeline(BasedGenerateTaskPipeline[EasyUIAppGenerat
                     continue
         if publisher:
             publisher.publish(None)
-        if self._conversation_name_generate_thread:
-            logger.debug("Conversation name generation running as daemon thread")
+        if self._conversation_name_generate_future:
+            logger.debug("Conversation name generation running in background")
 
     @staticmethod
     def _chunk_delta_text(chunk: LLMResultChunk) -> str | None:
@@ -1,10 +1,16 @@
 import hashlib
 import logging
-from threading import Thread, Timer
+import os
+import queue
+import time
+from collections.abc import Callable
+from concurrent.futures import Future
+from dataclasses import dataclass
+from threading import Lock, Thread
 from typing import Union
 
 from flask import Flask, current_app
-from sqlalchemy import select
+from sqlalchemy import select, update
 from sqlalchemy.orm import Session
 
 from configs import dify_config
@@ -41,8 +47,71 @@ from services.annotation_service import AppAnnotationService
 
 logger = logging.getLogger(__name__)
 
+# seconds to wait before reading a new conversation, so the caller can commit it first
+_CONVERSATION_NAME_COMMIT_GRACE_SECONDS = 1
+
+
+@dataclass(frozen=True)
+class _ConversationNameJob:
+    conversation_id: str
+    run: Callable[[], None]
+    not_before: float
+    future: Future[None]
+
+
+# background conversation naming runs on a bounded set of daemon workers fed from one
+# queue, so bursts of new conversations neither start a thread each nor run unbounded
+# LLM calls; daemon workers drop pending jobs at exit instead of holding the process
+_conversation_name_queue: queue.Queue[_ConversationNameJob] = queue.Queue()
+_conversation_name_workers: list[Thread] = []
+_conversation_name_workers_lock = Lock()
+
+
+def _run_conversation_name_job(job: _ConversationNameJob) -> None:
+    # every job gets the same grace period, so the queue is in deadline order and
+    # waiting here never holds back a job that is already due
+    delay = job.not_before - time.monotonic()
+    if delay > 0:
+        time.sleep(delay)
+    if not job.future.set_running_or_notify_cancel():
+        return
+    try:
+        job.run()
+    except Exception as e:
+        logger.exception("generate conversation name failed, conversation_id: %s", job.conversation_id)
+        job.future.set_exception(e)
+    else:
+        job.future.set_result(None)
+
+
+def _conversation_name_worker_loop() -> None:
+    while True:
+        _run_conversation_name_job(_conversation_name_queue.get())
+
+
+def _ensure_conversation_name_workers() -> None:
+    with _conversation_name_workers_lock:
+        # workers are started lazily and re-created after a fork, which only keeps the calling thread
+        _conversation_name_workers[:] = [worker for worker in _conversation_name_workers if worker.is_alive()]
+        while len(_conversation_name_workers) < dify_config.CONVERSATION_NAME_GENERATION_WORKERS:
+            worker = Thread(
+                target=_conversation_name_worker_loop,
+                name=f"conversation-name-{len(_conversation_name_workers)}",
+                daemon=True,
+            )
+            worker.start()
+            _conversation_name_workers.append(worker)
+
 
 class MessageCycleManager:
+    __slots__ = (
+        "_application_generate_entity",
+        "_message_has_file",
+        "_show_retrieve_source",
+        "_task_id",
+        "_task_state",
+    )
+
     def __init__(
         self,
         *,
@@ -56,6 +125,12 @@ class MessageCycleManager:
     ):
         self._application_generate_entity = application_generate_entity
         self._task_state = task_state
+        self._task_id: str = application_generate_entity.task_id
+        # resolved once, retriever resource events can arrive many times per stream
+        additional_features = application_generate_entity.app_config.additional_features
+        self._show_retrieve_source: bool | None = (
+            bool(additional_features.show_retrieve_source) if additional_features else None
+        )
         self._message_has_file: set[str] = set()
 
     def get_message_event_type(self, message_id: str) -> StreamEvent:
@@ -75,12 +150,12 @@ class MessageCycleManager:
 
         return StreamEvent.MESSAGE
 
-    def generate_conversation_name(self, *, conversation_id: str, query: str) -> Thread | None:
+    def generate_conversation_name(self, *, conversation_id: str, query: str) -> Future[None] | None:
         """
         Generate conversation name.
         :param conversation_id: conversation id
         :param query: query
-        :return: thread
+        :return: future of the background generation task
         """
         if isinstance(self._application_generate_entity, CompletionAppGenerateEntity):
             return None
@@ -89,63 +164,58 @@ class MessageCycleManager:
         extras = self._application_generate_entity.extras
         auto_generate_conversation_name = extras.get("auto_generate_conversation_name", True)
 
-        thread: Thread | None = None
+        future: Future[None] | None = None
         if auto_generate_conversation_name and is_first_message:
-            # start generate thread
-            # time.sleep not block other logic
-            thread = Timer(
-                1,
-                self._generate_conversation_name_worker,
-                kwargs={
-                    "flask_app": current_app._get_current_object(),  # type: ignore
-                    "conversation_id": conversation_id,
-                    "query": query,
-                },
+            # queue for the shared workers so other logic is not blocked
+            flask_app: Flask = current_app._get_current_object()  # type: ignore
+            future = Future()
+            _conversation_name_queue.put(
+                _ConversationNameJob(
+                    conversation_id=conversation_id,
+                    run=lambda: self._generate_conversation_name_worker(flask_app, conversation_id, query),
+                    not_before=time.monotonic() + _CONVERSATION_NAME_COMMIT_GRACE_SECONDS,
+                    future=future,
+                )
             )
-            thread.daemon = True
-            thread.start()
+            _ensure_conversation_name_workers()
 
         if is_first_message:
             self._application_generate_entity.is_new_conversation = False
 
-        return thread
+        return future
 
     def _generate_conversation_name_worker(self, flask_app: Flask, conversation_id: str, query: str):
         with flask_app.app_context():
+            # only the columns needed to generate the name are loaded; the session is
+            # closed before the LLM call so no transaction is held open across it
             with session_factory.create_session() as session:
-                # get conversation and message
-                stmt = select(Conversation).where(Conversation.id == conversation_id)
-                conversation = session.scalar(stmt)
-
-                if not conversation:
-                    return
-
-                if conversation.mode != AppMode.COMPLETION:
-                    app_model = session.get(App, conversation.app_id)
-                    if not app_model:
-                        return
-
-                    # generate conversation name
-                    query_hash = hashlib.md5(query.encode()).hexdigest()[:16]
-                    cache_key = f"conv_name:{conversation_id}:{query_hash}"
-
-                    cached_name = redis_client.get(cache_key)
-                    if cached_name:
-                        name = cached_name.decode("utf-8")
-                    else:
-                        try:
-                            name = LLMGenerator.generate_conversation_name(
-                                app_model.tenant_id, query, conversation_id, conversation.app_id
-                            )
-                            redis_client.setex(cache_key, 3600, name)
-                        except Exception:
-                            if dify_config.DEBUG:
-                                logger.exception(
-                                    "generate conversation name failed, conversation_id: %s", conversation_id
-                                )
-                            name = query[:47] + "..." if len(query) > 50 else query
-                    conversation.name = name
-                    session.commit()
+                row = session.execute(
+                    select(Conversation.mode, Conversation.app_id, App.tenant_id)
+                    .outerjoin(App, App.id == Conversation.app_id)
+                    .where(Conversation.id == conversation_id)
+                ).first()
+
+            if not row or row.mode == AppMode.COMPLETION or row.tenant_id is None:
+                return
+
+            # generate conversation name
+            query_hash = hashlib.md5(query.encode()).hexdigest()[:16]
+            cache_key = f"conv_name:{conversation_id}:{query_hash}"
+
+            cached_name = redis_client.get(cache_key)
+            if cached_name:
+                name = cached_name.decode("utf-8")
+            else:
+                try:
+                    name = LLMGenerator.generate_conversation_name(row.tenant_id, query, conversation_id, row.app_id)
+                    redis_client.setex(cache_key, 3600, name)
+                except Exception:
+                    if dify_config.DEBUG:
+                        logger.exception("generate conversation name failed, conversation_id: %s", conversation_id)
+                    name = query[:47] + "..." if len(query) > 50 else query
+
+            with session_factory.create_session() as session, session.begin():
+                session.execute(update(Conversation).where(Conversation.id == conversation_id).values(name=name))
 
     def handle_annotation_reply(self, event: QueueAnnotationReplyEvent, session: Session) -> MessageAnnotation | None:
         """
@@ -174,9 +244,9 @@ class MessageCycleManager:
         :param event: event
         :return:
         """
-        if not self._application_generate_entity.app_config.additional_features:
+        if self._show_retrieve_source is None:
             raise ValueError("Additional features not found")
-        if self._application_generate_entity.app_config.additional_features.show_retrieve_source:
+        if self._show_retrieve_source:
             merged_resources = [r for r in self._task_state.metadata.retriever_resources or [] if r]
             existing_ids = {(r.dataset_id, r.document_id) for r in merged_resources if r.dataset_id and r.document_id}
 
@@ -211,26 +281,18 @@ class MessageCycleManager:
         if message_file and message_file.url is not None:
             self._message_has_file.add(message_file.message_id)
 
-            # get tool file id
-            tool_file_id = message_file.url.split("/")[-1]
-            # trim extension
-            tool_file_id = tool_file_id.split(".")[0]
-
-            # get extension
-            if "." in message_file.url:
-                extension = f".{message_file.url.split('.')[-1]}"
-                if len(extension) > 10:
-                    extension = ".bin"
-            else:
-                extension = ".bin"
-            # add sign url to local file
             if message_file.url.startswith("http"):
                 url = message_file.url
             else:
+                # get tool file id and extension from the last path segment
+                tool_file_id, extension = os.path.splitext(os.path.basename(message_file.url))
+                if not extension or len(extension) > 10:
+                    extension = ".bin"
+                # add sign url to local file
                 url = sign_tool_file(tool_file_id=tool_file_id, extension=extension)
 
-            return MessageFileStreamResponse(
-                task_id=self._application_generate_entity.task_id,
+            return MessageFileStreamResponse.model_construct(
+                task_id=self._task_id,
                 id=message_file.id,
                 type=message_file.type,
                 belongs_to=message_file.belongs_to or MessageFileBelongsTo.USER,
@@ -252,8 +314,9 @@ class MessageCycleManager:
         :param message_id: message id
         :return:
         """
-        return MessageStreamResponse(
-            task_id=self._application_generate_entity.task_id,
+        # built once per streamed chunk from trusted internal state, so skip validation
+        return MessageStreamResponse.model_construct(
+            task_id=self._task_id,
             id=message_id,
             answer=answer,
             from_variable_selector=from_variable_selector or [],
@@ -266,6 +329,4 @@ class MessageCycleManager:
         :param answer: answer
         :return:
         """
-        return MessageReplaceStreamResponse(
-            task_id=self._application_generate_entity.task_id, answer=answer, reason=reason
-        )
+        return MessageReplaceStreamResponse.model_construct(task_id=self._task_id, answer=answer, reason=reason)
@@ -213,7 +213,7 @@ class KnowledgeRetrievalNode(Node[KnowledgeRetrievalNodeData]):
                     app_id=dify_ctx.app_id,
                     user_from=dify_ctx.user_from.value,
                     dataset_ids=dataset_ids,
-                    retrieval_mode=DatasetRetrieveConfigEntity.RetrieveStrategy.SINGLE.value,
+                    retrieval_mode=DatasetRetrieveConfigEntity.RetrieveStrategy.SINGLE,
                     completion_params=model.completion_params,
                     model_provider=model.provider,
                     model_mode=model.mode,
@@ -268,7 +268,7 @@ class KnowledgeRetrievalNode(Node[KnowledgeRetrievalNodeData]):
                     user_from=dify_ctx.user_from.value,
                     dataset_ids=dataset_ids,
                     query=query,
-                    retrieval_mode=DatasetRetrieveConfigEntity.RetrieveStrategy.MULTIPLE.value,
+                    retrieval_mode=DatasetRetrieveConfigEntity.RetrieveStrategy.MULTIPLE,
                     top_k=node_data.multiple_retrieval_config.top_k,
                     score_threshold=node_data.multiple_retrieval_config.score_threshold
                     if node_data.multiple_retrieval_config.score_threshold is not None
@@ -1,8 +1,9 @@
-import json
-from typing import Any, TypedDict, override
+import uuid
+from functools import lru_cache
+from typing import Any, TypedDict, cast, override
 
 import chromadb
-from chromadb import QueryResult, Settings
+from chromadb import Collection, QueryResult, Settings
 from pydantic import BaseModel
 
 from configs import dify_config
@@ -12,6 +13,7 @@ from core.rag.datasource.vdb.vector_type import VectorType
 from core.rag.embedding.embedding_base import Embeddings
 from core.rag.models.document import Document
 from extensions.ext_redis import redis_client
+from libs.orjson import orjson_dumps
 from models.dataset import Dataset
 
 
@@ -24,6 +26,17 @@ class ChromaParamsDict(TypedDict):
     settings: Settings
 
 
+@lru_cache(maxsize=32)
+def _get_chroma_settings(auth_provider: str | None, auth_credentials: str | None) -> Settings:
+    # Settings is a pydantic BaseSettings that re-reads the environment on every
+    # construction, so build one template per distinct auth configuration
+    return Settings(
+        # auth
+        chroma_client_auth_provider=auth_provider,
+        chroma_client_auth_credentials=auth_credentials,
+    )
+
+
 class ChromaConfig(BaseModel):
     host: str
     port: int
@@ -33,11 +46,9 @@ class ChromaConfig(BaseModel):
     auth_credentials: str | None = None
 
     def to_chroma_params(self) -> ChromaParamsDict:
-        settings = Settings(
-            # auth
-            chroma_client_auth_provider=self.auth_provider,
-            chroma_client_auth_credentials=self.auth_credentials,
-        )
+        # chromadb.HttpClient writes the server address onto the Settings it is given,
+        # so every caller gets its own copy of the cached template
+        settings = _get_chroma_settings(self.auth_provider, self.auth_credentials).copy()
         result: ChromaParamsDict = {
             "host": self.host,
             "port": self.port,
@@ -54,6 +65,13 @@ class ChromaVector(BaseVector):
         super().__init__(collection_name)
         self._client_config = config
         self._client = chromadb.HttpClient(**self._client_config.to_chroma_params())
+        self._collection: Collection | None = None
+
+    def _get_collection(self) -> Collection:
+        # reuse the handle to avoid a round-trip to the Chroma server on every operation
+        if self._collection is None:
+            self._collection = self._client.get_or_create_collection(self._collection_name)
+        return self._collection
 
     @override
     def get_type(self) -> str:
@@ -68,9 +86,12 @@ class ChromaVector(BaseVector):
             self.add_texts(texts, embeddings, **kwargs)
 
     def create_collection(self, collection_name: str):
+        collection_exist_cache_key = f"vector_indexing_{self._collection_name}"
+        # fast path: skip the distributed lock when the collection is already known to exist
+        if redis_client.get(collection_exist_cache_key):
+            return
         lock_name = f"vector_indexing_lock_{collection_name}"
         with redis_client.lock(lock_name, timeout=20):
-            collection_exist_cache_key = f"vector_indexing_{self._collection_name}"
             if redis_client.get(collection_exist_cache_key):
                 return
             self._client.get_or_create_collection(collection_name)
@@ -78,76 +99,81 @@ class ChromaVector(BaseVector):
 
     @override
     def add_texts(self, documents: list[Document], embeddings: list[list[float]], **kwargs) -> list[str]:
-        uuids = self._get_uuids(documents)
-        texts = [d.page_content for d in documents]
-        metadatas = [d.metadata for d in documents]
-
-        collection = self._client.get_or_create_collection(self._collection_name)
-        # FIXME: chromadb using numpy array, fix the type error later
-        collection.upsert(ids=uuids, documents=texts, embeddings=embeddings, metadatas=metadatas)  # type: ignore
+        # build ids, texts and metadatas in one pass; every document gets an id so the lists stay aligned
+        uuids: list[str] = []
+        texts: list[str] = []
+        metadatas: list[dict[str, Any]] = []
+        for document in documents:
+            uuids.append(document.metadata.get("doc_id") or str(uuid.uuid4()))
+            texts.append(document.page_content)
+            metadatas.append(document.metadata)
+
+        collection = self._get_collection()
+        # upsert in batches to avoid building a single multi-MB request body
+        batch_size = 256
+        for i in range(0, len(uuids), batch_size):
+            # FIXME: chromadb using numpy array, fix the type error later
+            collection.upsert(
+                ids=uuids[i : i + batch_size],
+                documents=texts[i : i + batch_size],
+                embeddings=embeddings[i : i + batch_size],  # type: ignore
+                metadatas=metadatas[i : i + batch_size],  # type: ignore
+            )
         return uuids
 
     @override
     def delete_by_metadata_field(self, key: str, value: str):
-        collection = self._client.get_or_create_collection(self._collection_name)
+        collection = self._get_collection()
         # FIXME: fix the type error later
         collection.delete(where={key: {"$eq": value}})  # type: ignore
 
     @override
     def delete(self):
         self._client.delete_collection(self._collection_name)
+        self._collection = None
 
     @override
     def delete_by_ids(self, ids: list[str]):
         if not ids:
             return
-        collection = self._client.get_or_create_collection(self._collection_name)
+        collection = self._get_collection()
         collection.delete(ids=ids)
 
     @override
     def text_exists(self, id: str) -> bool:
-        collection = self._client.get_or_create_collection(self._collection_name)
-        response = collection.get(ids=[id])
-        return len(response) > 0
+        collection = self._get_collection()
+        # only the ids are needed to check existence, skip documents/metadatas/embeddings
+        response = collection.get(ids=[id], include=[])
+        return bool(response and response.get("ids"))
 
     @override
     def search_by_vector(self, query_vector: list[float], **kwargs: Any) -> list[Document]:
-        collection = self._client.get_or_create_collection(self._collection_name)
+        collection = self._get_collection()
+        query_kwargs: dict[str, Any] = {"query_embeddings": query_vector, "n_results": kwargs.get("top_k", 4)}
         document_ids_filter = kwargs.get("document_ids_filter")
-        results: QueryResult
         if document_ids_filter:
-            results = collection.query(
-                query_embeddings=query_vector,
-                n_results=kwargs.get("top_k", 4),
-                where={"document_id": {"$in": document_ids_filter}},  # type: ignore
-            )
-        else:
-            results = collection.query(query_embeddings=query_vector, n_results=kwargs.get("top_k", 4))  # type: ignore
+            query_kwargs["where"] = {"document_id": {"$in": document_ids_filter}}
+        results: QueryResult = collection.query(**query_kwargs)
         score_threshold = float(kwargs.get("score_threshold") or 0.0)
 
         # Check if results contain data
         if not results["ids"] or not results["documents"] or not results["metadatas"] or not results["distances"]:
             return []
 
-        ids = results["ids"][0]
         documents = results["documents"][0]
         metadatas = results["metadatas"][0]
         distances = results["distances"][0]
 
         docs = []
-        for index in range(len(ids)):
-            distance = distances[index]
-            metadata = dict(metadatas[index])
+        for document, metadata, distance in zip(documents, metadatas, distances):
             score = 1 - distance
             if score >= score_threshold:
+                # chroma deserializes fresh metadata dicts per response, so attach the score in place
+                metadata = cast(dict[str, Any], metadata)
                 metadata["score"] = score
-                doc = Document(
-                    page_content=documents[index],
-                    metadata=metadata,
-                )
-                docs.append(doc)
+                docs.append(Document(page_content=document, metadata=metadata))
         # Sort the documents by score in descending order
-        docs = sorted(docs, key=lambda x: x.metadata["score"] if x.metadata is not None else 0, reverse=True)
+        docs.sort(key=lambda x: x.metadata["score"], reverse=True)
         return docs
 
     @override
@@ -169,7 +195,7 @@ class ChromaVectorFactory(AbstractVectorFactory):
                 "type": VectorType.CHROMA,
                 "vector_store": {"class_prefix": collection_name},
             }
-            dataset.index_struct = json.dumps(index_struct_dict)
+            dataset.index_struct = orjson_dumps(index_struct_dict)
 
         return ChromaVector(
             collection_name=collection_name,
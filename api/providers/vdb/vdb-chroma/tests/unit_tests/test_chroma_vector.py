@@ -1,4 +1,5 @@
 import importlib
+import json
 import sys
 import types
 from collections import UserDict
@@ -20,6 +21,9 @@ def _build_fake_chroma_modules():
             for key, value in kwargs.items():
                 setattr(self, key, value)
 
+        def copy(self):
+            return Settings(**vars(self))
+
     class QueryResult(UserDict):
         pass
 
@@ -32,12 +36,21 @@ def _build_fake_chroma_modules():
 
     class _Client:
         def __init__(self, **kwargs):
+            settings = kwargs.get("settings")
+            if settings is not None:
+                # like chromadb.HttpClient, claim the Settings for this server and
+                # reject one already bound to a different server
+                bound_host = getattr(settings, "chroma_server_host", None)
+                if bound_host and bound_host != kwargs["host"]:
+                    raise ValueError(f"settings already bound to {bound_host}")
+                settings.chroma_server_host = kwargs["host"]
             self.kwargs = kwargs
             self.collection = _Collection()
             self.get_or_create_collection = MagicMock(return_value=self.collection)
             self.delete_collection = MagicMock()
 
     chroma.Settings = Settings
+    chroma.Collection = _Collection
     chroma.QueryResult = QueryResult
     chroma.HttpClient = _Client
     return chroma
@@ -73,6 +86,30 @@ def test_chroma_config_to_params_builds_expected_payload(chroma_module):
     assert params["settings"].chroma_client_auth_credentials == "credentials"
 
 
+def test_chroma_clients_with_same_auth_get_separate_settings(chroma_module):
+    def connect(host: str):
+        return chroma_module.ChromaVector(
+            collection_name="collection_1",
+            config=chroma_module.ChromaConfig(
+                host=host,
+                port=8000,
+                tenant="t",
+                database="d",
+                auth_provider="provider",
+                auth_credentials="credentials",
+            ),
+        )._client.kwargs["settings"]
+
+    first = connect("chroma-a")
+    second = connect("chroma-b")
+
+    assert first is not second
+    assert first.chroma_server_host == "chroma-a"
+    assert second.chroma_server_host == "chroma-b"
+    assert second.chroma_client_auth_credentials == "credentials"
+    assert chroma_module._get_chroma_settings.cache_info().hits == 1
+
+
 def test_create_collection_uses_redis_lock_and_cache(chroma_module, monkeypatch: pytest.MonkeyPatch):
     lock = MagicMock()
     lock.__enter__.return_value = None
@@ -91,6 +128,22 @@ def test_create_collection_uses_redis_lock_and_cache(chroma_module, monkeypatch:
     chroma_module.redis_client.set.assert_called_once()
 
 
+def test_create_collection_skips_lock_when_cached(chroma_module, monkeypatch: pytest.MonkeyPatch):
+    monkeypatch.setattr(chroma_module.redis_client, "lock", MagicMock())
+    monkeypatch.setattr(chroma_module.redis_client, "get", MagicMock(return_value=b"1"))
+    monkeypatch.setattr(chroma_module.redis_client, "set", MagicMock())
+
+    vector = chroma_module.ChromaVector(
+        collection_name="collection_1",
+        config=chroma_module.ChromaConfig(host="localhost", port=8000, tenant="t", database="d"),
+    )
+    vector.create_collection("collection_1")
+
+    chroma_module.redis_client.lock.assert_not_called()
+    vector._client.get_or_create_collection.assert_not_called()
+    chroma_module.redis_client.set.assert_not_called()
+
+
 def test_create_with_empty_texts_is_noop(chroma_module):
     vector = chroma_module.ChromaVector(
         collection_name="collection_1",
@@ -112,6 +165,60 @@ def test_create_with_texts_creates_collection_and_upserts(chroma_module):
     vector._client.collection.upsert.assert_called_once()
 
 
+def test_add_texts_upserts_in_batches(chroma_module):
+    vector = chroma_module.ChromaVector(
+        collection_name="collection_1",
+        config=chroma_module.ChromaConfig(host="localhost", port=8000, tenant="t", database="d"),
+    )
+    docs = [Document(page_content=f"text-{i}", metadata={"doc_id": f"d{i}"}) for i in range(300)]
+    embeddings = [[float(i)] for i in range(300)]
+
+    ids = vector.add_texts(docs, embeddings)
+
+    assert ids == [f"d{i}" for i in range(300)]
+    upsert = vector._client.collection.upsert
+    assert upsert.call_count == 2
+    first, second = (call.kwargs for call in upsert.call_args_list)
+    assert len(first["ids"]) == 256
+    assert second["ids"] == [f"d{i}" for i in range(256, 300)]
+    assert second["documents"][0] == "text-256"
+    assert second["embeddings"][0] == [256.0]
+
+
+def test_add_texts_generates_ids_for_documents_without_doc_id(chroma_module):
+    vector = chroma_module.ChromaVector(
+        collection_name="collection_1",
+        config=chroma_module.ChromaConfig(host="localhost", port=8000, tenant="t", database="d"),
+    )
+    docs = [
+        Document(page_content="first", metadata={"doc_id": "d1"}),
+        Document(page_content="second", metadata={}),
+    ]
+
+    ids = vector.add_texts(docs, [[0.1], [0.2]])
+
+    assert ids[0] == "d1"
+    assert ids[1]
+    upsert_kwargs = vector._client.collection.upsert.call_args.kwargs
+    assert upsert_kwargs["ids"] == ids
+    assert upsert_kwargs["documents"] == ["first", "second"]
+
+
+def test_collection_handle_is_cached_until_delete(chroma_module):
+    vector = chroma_module.ChromaVector(
+        collection_name="collection_1",
+        config=chroma_module.ChromaConfig(host="localhost", port=8000, tenant="t", database="d"),
+    )
+
+    vector.delete_by_ids(["id-1"])
+    vector.delete_by_metadata_field("document_id", "doc-1")
+    vector._client.get_or_create_collection.assert_called_once_with("collection_1")
+
+    vector.delete()
+    vector.delete_by_ids(["id-1"])
+    assert vector._client.get_or_create_collection.call_count == 2
+
+
 def test_delete_methods_and_text_exists(chroma_module):
     vector = chroma_module.ChromaVector(
         collection_name="collection_1",
@@ -129,8 +236,11 @@ def test_delete_methods_and_text_exists(chroma_module):
 
     vector._client.collection.get.return_value = {"ids": ["id-1"]}
     assert vector.text_exists("id-1") is True
-    vector._client.collection.get.return_value = {}
+    vector._client.collection.get.assert_called_with(ids=["id-1"], include=[])
+    vector._client.collection.get.return_value = {"ids": []}
     assert vector.text_exists("id-2") is False
+    vector._client.collection.get.return_value = {}
+    assert vector.text_exists("id-3") is False
 
     vector.delete()
     vector._client.delete_collection.assert_called_once_with("collection_1")
@@ -160,11 +270,33 @@ def test_search_by_vector_applies_score_threshold_and_sorting(chroma_module):
 
     docs = vector.search_by_vector([0.1, 0.2], top_k=2, score_threshold=0.5, document_ids_filter=["doc-1"])
 
+    vector._client.collection.query.assert_called_once_with(
+        query_embeddings=[0.1, 0.2], n_results=2, where={"document_id": {"$in": ["doc-1"]}}
+    )
     assert len(docs) == 1
     assert docs[0].page_content == "doc high"
     assert docs[0].metadata["score"] == 0.9
 
 
+def test_search_by_vector_orders_results_by_score(chroma_module):
+    vector = chroma_module.ChromaVector(
+        collection_name="collection_1",
+        config=chroma_module.ChromaConfig(host="localhost", port=8000, tenant="t", database="d"),
+    )
+    vector._client.collection.query.return_value = {
+        "ids": [["id-1", "id-2", "id-3"]],
+        "documents": [["doc mid", "doc high", "doc low"]],
+        "metadatas": [[{"doc_id": "id-1"}, {"doc_id": "id-2"}, {"doc_id": "id-3"}]],
+        "distances": [[0.4, 0.2, 0.6]],
+    }
+
+    docs = vector.search_by_vector([0.1, 0.2], top_k=3)
+
+    vector._client.collection.query.assert_called_once_with(query_embeddings=[0.1, 0.2], n_results=3)
+    assert [doc.page_content for doc in docs] == ["doc high", "doc mid", "doc low"]
+    assert all(isinstance(doc.metadata["score"], float) for doc in docs)
+
+
 def test_search_by_full_text_returns_empty_list(chroma_module):
     vector = chroma_module.ChromaVector(
         collection_name="collection_1",
@@ -196,4 +328,7 @@ def test_factory_init_vector_uses_existing_or_generated_collection(chroma_module
     assert result_2 == "vector"
     assert vector_cls.call_args_list[0].kwargs["collection_name"] == "existing"
     assert vector_cls.call_args_list[1].kwargs["collection_name"] == "auto_collection"
-    assert dataset_without_index.index_struct is not None
+    assert json.loads(dataset_without_index.index_struct) == {
+        "type": "chroma",
+        "vector_store": {"class_prefix": "auto_collection"},
+    }
@@ -24,7 +24,7 @@ class DummyPromptType:
         self.SIMPLE = DummyEnumValue("simple")
         self.ADVANCED = DummyEnumValue("advanced")
 
-    def value_of(self, value):
+    def __call__(self, value):
         for enum_value in self:
             if enum_value.value == value:
                 return enum_value
@@ -2,9 +2,11 @@ from collections import UserDict
 from unittest.mock import MagicMock
 
 import pytest
+from pydantic import ValidationError
 from pytest_mock import MockerFixture
 
 from core.app.app_config.base_app_config_manager import BaseAppConfigManager
+from core.app.app_config.entities import AppConfig, EasyUIBasedAppModelConfigFrom
 
 
 class TestBaseAppConfigManager:
@@ -181,3 +183,29 @@ class TestBaseAppConfigManager:
         assert result == mock_app_additional_features
         for manager in mock_managers.values():
             assert manager.called
+
+    def test_build_config_validates_configs_supplied_with_request(self):
+        # Act & Assert
+        with pytest.raises(ValidationError):
+            BaseAppConfigManager._build_config(
+                AppConfig, EasyUIBasedAppModelConfigFrom.ARGS, tenant_id="tenant", app_id="app", app_mode="unknown"
+            )
+
+    @pytest.mark.parametrize(
+        "config_from",
+        [
+            None,
+            EasyUIBasedAppModelConfigFrom.APP_LATEST_CONFIG,
+            EasyUIBasedAppModelConfigFrom.CONVERSATION_SPECIFIC_CONFIG,
+        ],
+    )
+    def test_build_config_skips_validation_for_stored_configs(self, config_from):
+        # Act
+        result = BaseAppConfigManager._build_config(
+            AppConfig, config_from, tenant_id="tenant", app_id="app", app_mode="unknown"
+        )
+
+        # Assert
+        assert isinstance(result, AppConfig)
+        assert result.app_mode == "unknown"
+        assert result.variables == []
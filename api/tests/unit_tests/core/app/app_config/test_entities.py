@@ -29,15 +29,16 @@ class TestAppConfigEntities:
                 json_schema={"type": "string", "minLength": "bad"},
             )
 
-    def test_prompt_template_value_of(self):
-        assert PromptTemplateEntity.PromptType.value_of("simple") == PromptTemplateEntity.PromptType.SIMPLE
+    def test_prompt_type_from_value(self):
+        assert PromptTemplateEntity.PromptType("simple") == PromptTemplateEntity.PromptType.SIMPLE
+        assert PromptTemplateEntity.PromptType.SIMPLE == "simple"
         with pytest.raises(ValueError):
-            PromptTemplateEntity.PromptType.value_of("missing")
+            PromptTemplateEntity.PromptType("missing")
 
-    def test_dataset_retrieve_strategy_value_of(self):
+    def test_dataset_retrieve_strategy_from_value(self):
         assert (
-            DatasetRetrieveConfigEntity.RetrieveStrategy.value_of("single")
+            DatasetRetrieveConfigEntity.RetrieveStrategy("single")
             == DatasetRetrieveConfigEntity.RetrieveStrategy.SINGLE
         )
         with pytest.raises(ValueError):
-            DatasetRetrieveConfigEntity.RetrieveStrategy.value_of("missing")
+            DatasetRetrieveConfigEntity.RetrieveStrategy("missing")
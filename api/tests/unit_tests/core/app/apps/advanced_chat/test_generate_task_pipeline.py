@@ -148,7 +148,9 @@ def test_handle_workflow_paused_event_persists_human_input_extra_content() -> No
 
 
 def test_resume_appends_chunks_to_paused_answer() -> None:
-    app_config = SimpleNamespace(app_id="app-1", tenant_id="tenant-1", sensitive_word_avoidance=None)
+    app_config = SimpleNamespace(
+        app_id="app-1", tenant_id="tenant-1", sensitive_word_avoidance=None, additional_features=None
+    )
     application_generate_entity = SimpleNamespace(
         app_config=app_config,
         files=[],
@@ -266,7 +268,7 @@ def test_process_stream_response_breaks_after_workflow_succeeded() -> None:
         SimpleNamespace(event=ping_event),
     ]
 
-    pipeline._conversation_name_generate_thread = None
+    pipeline._conversation_name_generate_future = None
     pipeline._base_task_pipeline = mock.Mock()
     pipeline._base_task_pipeline.queue_manager = mock.Mock()
     pipeline._base_task_pipeline.queue_manager.listen.return_value = iter(queue_messages)
@@ -291,7 +293,7 @@ def test_process_stream_response_breaks_after_workflow_partial_success() -> None
         SimpleNamespace(event=ping_event),
     ]
 
-    pipeline._conversation_name_generate_thread = None
+    pipeline._conversation_name_generate_future = None
     pipeline._base_task_pipeline = mock.Mock()
     pipeline._base_task_pipeline.queue_manager = mock.Mock()
     pipeline._base_task_pipeline.queue_manager.listen.return_value = iter(queue_messages)
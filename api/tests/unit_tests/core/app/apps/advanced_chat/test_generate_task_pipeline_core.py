@@ -591,13 +591,13 @@ class TestAdvancedChatGenerateTaskPipeline:
         pipeline = _make_pipeline()
         calls = {"retriever": 0, "annotation": 0}
 
-        def _hit_retriever(event):
+        def _hit_retriever(_manager, event):
             calls["retriever"] += 1
 
         def _hit_annotation(_manager, event, session):
             calls["annotation"] += 1
 
-        pipeline._message_cycle_manager.handle_retriever_resources = _hit_retriever
+        monkeypatch.setattr(type(pipeline._message_cycle_manager), "handle_retriever_resources", _hit_retriever)
         monkeypatch.setattr(type(pipeline._message_cycle_manager), "handle_annotation_reply", _hit_annotation)
 
         retriever_event = QueueRetrieverResourcesEvent(retriever_resources=[])
@@ -613,9 +613,13 @@ class TestAdvancedChatGenerateTaskPipeline:
         assert list(pipeline._handle_annotation_reply_event(annotation_event)) == []
         assert calls == {"retriever": 1, "annotation": 1}
 
-    def test_handle_message_replace_event(self):
+    def test_handle_message_replace_event(self, monkeypatch: pytest.MonkeyPatch):
         pipeline = _make_pipeline()
-        pipeline._message_cycle_manager.message_replace_to_stream_response = lambda **kwargs: "replace"
+        monkeypatch.setattr(
+            type(pipeline._message_cycle_manager),
+            "message_replace_to_stream_response",
+            lambda _manager, **kwargs: "replace",
+        )
 
         event = QueueMessageReplaceEvent(
             text="new",
@@ -699,7 +703,7 @@ class TestAdvancedChatGenerateTaskPipeline:
         assert responses == ["end"]
         assert saved == ["saved"]
 
-    def test_handle_message_end_event_applies_output_moderation(self):
+    def test_handle_message_end_event_applies_output_moderation(self, monkeypatch: pytest.MonkeyPatch):
         pipeline = _make_pipeline()
         pipeline._graph_runtime_state = GraphRuntimeState(
             variable_pool=VariablePool.from_bootstrap(
@@ -708,7 +712,11 @@ class TestAdvancedChatGenerateTaskPipeline:
             start_at=0.0,
         )
         pipeline._base_task_pipeline.handle_output_moderation_when_task_finished = lambda answer: "safe"
-        pipeline._message_cycle_manager.message_replace_to_stream_response = lambda **kwargs: "replace"
+        monkeypatch.setattr(
+            type(pipeline._message_cycle_manager),
+            "message_replace_to_stream_response",
+            lambda _manager, **kwargs: "replace",
+        )
         pipeline._message_end_to_stream_response = lambda: "end"
 
         saved: list[str] = []
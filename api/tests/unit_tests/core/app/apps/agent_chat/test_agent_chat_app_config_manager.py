@@ -66,7 +66,7 @@ class TestAgentChatAppConfigManagerGetAppConfig:
             return_value=("variables", "external"),
         )
         mocker.patch(
-            "core.app.apps.agent_chat.app_config_manager.AgentChatAppConfig",
+            "core.app.apps.agent_chat.app_config_manager.AgentChatAppConfig.model_construct",
             side_effect=lambda **kwargs: SimpleNamespace(**kwargs),
         )
 
@@ -99,7 +99,7 @@ class TestAgentChatAppConfigManagerGetAppConfig:
             return_value=("variables", "external"),
         )
         mocker.patch(
-            "core.app.apps.agent_chat.app_config_manager.AgentChatAppConfig",
+            "core.app.apps.agent_chat.app_config_manager.AgentChatAppConfig.model_construct",
             side_effect=lambda **kwargs: SimpleNamespace(**kwargs),
         )
 
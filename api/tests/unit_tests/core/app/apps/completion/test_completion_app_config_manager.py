@@ -50,7 +50,9 @@ class TestCompletionAppConfigManager:
         mocker.patch.object(module.DatasetConfigManager, "convert", return_value="dataset")
         mocker.patch.object(CompletionAppConfigManager, "convert_features", return_value="features")
         mocker.patch.object(module.BasicVariablesConfigManager, "convert", return_value=([], []))
-        mocker.patch.object(module, "CompletionAppConfig", side_effect=lambda **kwargs: SimpleNamespace(**kwargs))
+        mocker.patch.object(
+            module.CompletionAppConfig, "model_construct", side_effect=lambda **kwargs: SimpleNamespace(**kwargs)
+        )
 
         result = CompletionAppConfigManager.get_app_config(
             app_model=app_model,
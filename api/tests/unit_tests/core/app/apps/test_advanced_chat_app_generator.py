@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import queue
 from types import SimpleNamespace
 from unittest.mock import MagicMock
 
@@ -197,26 +198,15 @@ def test_message_cycle_manager_uses_new_conversation_flag(monkeypatch: pytest.Mo
     entity.is_new_conversation = True
     entity.extras = {"auto_generate_conversation_name": True}
 
-    captured = {}
-
-    class DummyThread:
-        def __init__(self, **kwargs):
-            self.kwargs = kwargs
-            self.started = False
-
-        def start(self):
-            self.started = True
-
-    def fake_thread(*args, **kwargs):
-        thread = DummyThread(**kwargs)
-        captured["thread"] = thread
-        return thread
-
-    monkeypatch.setattr(message_cycle_manager, "Timer", fake_thread)
+    pending = queue.Queue()
+    monkeypatch.setattr(message_cycle_manager, "_conversation_name_queue", pending)
+    monkeypatch.setattr(message_cycle_manager, "_ensure_conversation_name_workers", lambda: None)
+    monkeypatch.setattr(message_cycle_manager, "current_app", SimpleNamespace(_get_current_object=lambda: object()))
 
     manager = MessageCycleManager(application_generate_entity=entity, task_state=MagicMock())
-    thread = manager.generate_conversation_name(conversation_id="existing-conversation-id", query="hello")
+    future = manager.generate_conversation_name(conversation_id="existing-conversation-id", query="hello")
 
-    assert thread is captured["thread"]
-    assert thread.started is True
+    job = pending.get_nowait()
+    assert future is job.future
+    assert job.conversation_id == "existing-conversation-id"
     assert entity.is_new_conversation is False
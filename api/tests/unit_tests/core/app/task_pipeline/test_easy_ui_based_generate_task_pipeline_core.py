@@ -1,8 +1,8 @@
 from __future__ import annotations
 
 from collections.abc import Generator, Sequence
+from concurrent.futures import Future
 from datetime import UTC, datetime
-from threading import Thread
 from typing import cast
 from unittest.mock import Mock
 
@@ -273,6 +273,13 @@ def _set_method(obj: object, name: str, value: object) -> None:
     object.__setattr__(obj, name, value)
 
 
+def _set_cycle_manager_method(
+    monkeypatch: pytest.MonkeyPatch, pipeline: EasyUIBasedGenerateTaskPipeline, name: str, value: object
+) -> None:
+    # MessageCycleManager uses __slots__, so stubs go on the class for the duration of the test
+    monkeypatch.setattr(type(pipeline._message_cycle_manager), name, staticmethod(value))
+
+
 class TestEasyUiBasedGenerateTaskPipeline:
     def test_to_blocking_response_chat(self):
         conversation = _make_conversation(AppMode.CHAT)
@@ -372,7 +379,7 @@ class TestEasyUiBasedGenerateTaskPipeline:
         def _message_end() -> MessageEndStreamResponse:
             return MessageEndStreamResponse(task_id="task", id="msg")
 
-        _set_method(pipeline._message_cycle_manager, "get_message_event_type", _message_event_type)
+        _set_cycle_manager_method(monkeypatch, pipeline, "get_message_event_type", _message_event_type)
         _set_method(pipeline, "handle_output_moderation_when_task_finished", lambda completion: None)
         _set_method(pipeline, "_message_end_to_stream_response", _message_end)
         _set_method(pipeline, "_save_message", lambda **kwargs: None)
@@ -626,13 +633,14 @@ class TestEasyUiBasedGenerateTaskPipeline:
         def _agent_message_response(answer: str, message_id: str) -> AgentMessageStreamResponse:
             return AgentMessageStreamResponse(task_id="task", id=message_id, answer=answer)
 
-        _set_method(
-            pipeline._message_cycle_manager,
+        _set_cycle_manager_method(
+            monkeypatch,
+            pipeline,
             "handle_annotation_reply",
             lambda event, session: _AnnotationReply(content="annotated"),
         )
         _set_method(pipeline, "_agent_thought_to_stream_response", _agent_thought_response)
-        _set_method(pipeline._message_cycle_manager, "message_file_to_stream_response", _file_response)
+        _set_cycle_manager_method(monkeypatch, pipeline, "message_file_to_stream_response", _file_response)
         _set_method(pipeline, "_agent_message_to_stream_response", _agent_message_response)
         _set_method(pipeline, "handle_error", lambda **kwargs: ValueError("boom"))
         _set_method(pipeline, "error_to_stream_response", lambda err: ErrorStreamResponse(task_id="task", err=err))
@@ -749,7 +757,7 @@ class TestEasyUiBasedGenerateTaskPipeline:
         assert response.tool_input == ""
         assert response.model_dump(mode="json")["message_files"] == []
 
-    def test_process_routes_to_stream_and_starts_conversation_name_generation(self):
+    def test_process_routes_to_stream_and_starts_conversation_name_generation(self, monkeypatch: pytest.MonkeyPatch):
         conversation = _make_conversation(AppMode.CHAT)
         message = _make_message()
         pipeline = EasyUIBasedGenerateTaskPipeline(
@@ -759,7 +767,7 @@ class TestEasyUiBasedGenerateTaskPipeline:
             message=message,
             stream=True,
         )
-        pipeline._message_cycle_manager.generate_conversation_name = Mock(return_value=object())
+        _set_cycle_manager_method(monkeypatch, pipeline, "generate_conversation_name", Mock(return_value=object()))
         _set_method(
             pipeline,
             "_wrapper_process_stream_response",
@@ -774,7 +782,7 @@ class TestEasyUiBasedGenerateTaskPipeline:
             conversation_id="conv", query="hello"
         )
 
-    def test_process_routes_to_blocking_for_completion_mode(self):
+    def test_process_routes_to_blocking_for_completion_mode(self, monkeypatch: pytest.MonkeyPatch):
         conversation = _make_conversation(AppMode.COMPLETION)
         message = _make_message()
         pipeline = EasyUIBasedGenerateTaskPipeline(
@@ -784,7 +792,7 @@ class TestEasyUiBasedGenerateTaskPipeline:
             message=message,
             stream=False,
         )
-        pipeline._message_cycle_manager.generate_conversation_name = Mock()
+        _set_cycle_manager_method(monkeypatch, pipeline, "generate_conversation_name", Mock())
         _set_method(
             pipeline,
             "_wrapper_process_stream_response",
@@ -1013,8 +1021,9 @@ class TestEasyUiBasedGenerateTaskPipeline:
         _set_queue_events(pipeline, [_queue_message(QueueStopEvent(stopped_by=QueueStopEvent.StopBy.USER_MANUAL))])
         pipeline._handle_stop = Mock()
         _set_method(pipeline, "handle_output_moderation_when_task_finished", lambda answer: "moderated answer")
-        _set_method(
-            pipeline._message_cycle_manager,
+        _set_cycle_manager_method(
+            monkeypatch,
+            pipeline,
             "message_replace_to_stream_response",
             lambda answer: MessageReplaceStreamResponse(task_id="task", answer=answer, reason=""),
         )
@@ -1050,7 +1059,7 @@ class TestEasyUiBasedGenerateTaskPipeline:
         assert isinstance(responses[1], MessageEndStreamResponse)
         pipeline._handle_stop.assert_called_once()
 
-    def test_process_stream_response_handles_retriever_unknown_and_empty_chunk(self):
+    def test_process_stream_response_handles_retriever_unknown_and_empty_chunk(self, monkeypatch: pytest.MonkeyPatch):
         conversation = _make_conversation(AppMode.CHAT)
         message = _make_message()
         pipeline = EasyUIBasedGenerateTaskPipeline(
@@ -1071,7 +1080,7 @@ class TestEasyUiBasedGenerateTaskPipeline:
         def _handle_retriever_resources(event):
             handled["retriever"] += 1
 
-        pipeline._message_cycle_manager.handle_retriever_resources = _handle_retriever_resources
+        _set_cycle_manager_method(monkeypatch, pipeline, "handle_retriever_resources", _handle_retriever_resources)
         _set_queue_events(
             pipeline,
             [
@@ -1108,7 +1117,7 @@ class TestEasyUiBasedGenerateTaskPipeline:
 
         assert responses == []
 
-    def test_process_stream_response_ignores_unsupported_chunk_content_types(self):
+    def test_process_stream_response_ignores_unsupported_chunk_content_types(self, monkeypatch: pytest.MonkeyPatch):
         conversation = _make_conversation(AppMode.CHAT)
         message = _make_message()
         pipeline = EasyUIBasedGenerateTaskPipeline(
@@ -1124,7 +1133,9 @@ class TestEasyUiBasedGenerateTaskPipeline:
                 message=AssistantPromptMessage.model_construct(content=[object(), "ok"])
             ),
         )
-        _set_method(pipeline._message_cycle_manager, "get_message_event_type", lambda message_id: StreamEvent.MESSAGE)
+        _set_cycle_manager_method(
+            monkeypatch, pipeline, "get_message_event_type", lambda message_id: StreamEvent.MESSAGE
+        )
         _set_queue_events(pipeline, [_queue_message(QueueLLMChunkEvent.model_construct(chunk=chunk))])
 
         responses = list(pipeline._process_stream_response(publisher=None))
@@ -1134,7 +1145,7 @@ class TestEasyUiBasedGenerateTaskPipeline:
         assert responses[0].answer == "ok"
         assert pipeline._task_state.llm_result.message.content == "ok"
 
-    def test_process_stream_response_skips_none_chunk_content(self):
+    def test_process_stream_response_skips_none_chunk_content(self, monkeypatch: pytest.MonkeyPatch):
         conversation = _make_conversation(AppMode.CHAT)
         message = _make_message()
         pipeline = EasyUIBasedGenerateTaskPipeline(
@@ -1149,7 +1160,7 @@ class TestEasyUiBasedGenerateTaskPipeline:
             prompt_messages=[],
             delta=LLMResultChunkDelta(index=0, message=AssistantPromptMessage(content=None)),
         )
-        pipeline._message_cycle_manager.message_to_stream_response = Mock()
+        _set_cycle_manager_method(monkeypatch, pipeline, "message_to_stream_response", Mock())
         _set_queue_events(pipeline, [_queue_message(QueueLLMChunkEvent(chunk=chunk))])
 
         responses = list(pipeline._process_stream_response(publisher=None))
@@ -1158,7 +1169,7 @@ class TestEasyUiBasedGenerateTaskPipeline:
         pipeline._message_cycle_manager.message_to_stream_response.assert_not_called()
         assert pipeline._task_state.llm_result.message.content == ""
 
-    def test_process_stream_response_reaches_post_loop_branch_with_thread_reference(self):
+    def test_process_stream_response_reaches_post_loop_branch_with_future_reference(self):
         conversation = _make_conversation(AppMode.CHAT)
         message = _make_message()
         pipeline = EasyUIBasedGenerateTaskPipeline(
@@ -1168,7 +1179,7 @@ class TestEasyUiBasedGenerateTaskPipeline:
             message=message,
             stream=True,
         )
-        pipeline._conversation_name_generate_thread = Thread()
+        pipeline._conversation_name_generate_future = Future()
         _set_queue_events(pipeline, [])
 
         assert list(pipeline._process_stream_response(publisher=None)) == []
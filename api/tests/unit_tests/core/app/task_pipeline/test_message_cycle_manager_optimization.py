@@ -1,7 +1,9 @@
 """Unit tests for the message cycle manager optimization."""
 
 import logging
+import queue
 from collections.abc import Iterator
+from concurrent.futures import Future
 from dataclasses import dataclass
 from types import SimpleNamespace
 from unittest.mock import Mock, patch
@@ -266,54 +268,122 @@ class TestMessageCycleManagerOptimization:
 
         assert result is None
 
-    def test_generate_conversation_name_starts_thread_and_flips_first_message_flag(self, message_cycle_manager):
-        """Spawn background generation thread for the first chat message."""
+    def test_generate_conversation_name_queues_job_and_flips_first_message_flag(self, message_cycle_manager):
+        """Queue background name generation for the shared workers on the first chat message."""
         message_cycle_manager._application_generate_entity.is_new_conversation = True
         message_cycle_manager._application_generate_entity.extras = {"auto_generate_conversation_name": True}
         flask_app = object()
-
-        class DummyTimer:
-            def __init__(self, interval, function, args=None, kwargs=None):
-                self.interval = interval
-                self.function = function
-                self.args = args or []
-                self.kwargs = kwargs
-                self.daemon = False
-                self.started = False
-
-            def start(self):
-                self.started = True
+        pending = queue.Queue()
 
         with (
             patch(
                 "core.app.task_pipeline.message_cycle_manager.current_app",
                 new=SimpleNamespace(_get_current_object=lambda: flask_app),
             ),
-            patch("core.app.task_pipeline.message_cycle_manager.Timer", DummyTimer),
+            patch("core.app.task_pipeline.message_cycle_manager._conversation_name_queue", pending),
+            patch("core.app.task_pipeline.message_cycle_manager._ensure_conversation_name_workers") as mock_ensure,
+            patch.object(message_cycle_manager_module.time, "monotonic", return_value=100.0),
+            patch.object(MessageCycleManager, "_generate_conversation_name_worker") as mock_worker,
         ):
-            thread = message_cycle_manager.generate_conversation_name(conversation_id="conv-1", query="hello")
-
-        assert isinstance(thread, DummyTimer)
-        assert thread.interval == 1
-        assert thread.function == message_cycle_manager._generate_conversation_name_worker
-        assert thread.started is True
-        assert thread.daemon is True
-        assert thread.kwargs["flask_app"] is flask_app
-        assert thread.kwargs["conversation_id"] == "conv-1"
-        assert thread.kwargs["query"] == "hello"
+            future = message_cycle_manager.generate_conversation_name(conversation_id="conv-1", query="hello")
+            job = pending.get_nowait()
+            job.run()
+
+        assert future is job.future
+        assert job.conversation_id == "conv-1"
+        assert job.not_before == 101.0
+        mock_ensure.assert_called_once()
+        mock_worker.assert_called_once_with(flask_app, "conv-1", "hello")
         assert message_cycle_manager._application_generate_entity.is_new_conversation is False
 
-    def test_generate_conversation_name_skips_thread_when_auto_generate_disabled(self, message_cycle_manager):
-        """Skip thread creation when auto naming is disabled but still mark conversation as not new."""
+    def test_generate_conversation_name_skips_job_when_auto_generate_disabled(self, message_cycle_manager):
+        """Skip queueing when auto naming is disabled but still mark conversation as not new."""
         message_cycle_manager._application_generate_entity.is_new_conversation = True
         message_cycle_manager._application_generate_entity.extras = {"auto_generate_conversation_name": False}
+        pending = queue.Queue()
 
-        with patch("core.app.task_pipeline.message_cycle_manager.Timer") as mock_timer:
+        with patch("core.app.task_pipeline.message_cycle_manager._conversation_name_queue", pending):
             result = message_cycle_manager.generate_conversation_name(conversation_id="conv-2", query="hello")
 
         assert result is None
         assert message_cycle_manager._application_generate_entity.is_new_conversation is False
-        mock_timer.assert_not_called()
+        assert pending.empty()
+
+    def test_run_conversation_name_job_waits_for_commit_grace_period(self):
+        """Sleep only for the part of the grace period that has not elapsed yet."""
+        run = Mock()
+        job = message_cycle_manager_module._ConversationNameJob(
+            conversation_id="conv-1", run=run, not_before=100.5, future=Future()
+        )
+
+        with (
+            patch.object(message_cycle_manager_module.time, "monotonic", return_value=100.0),
+            patch.object(message_cycle_manager_module.time, "sleep") as mock_sleep,
+        ):
+            message_cycle_manager_module._run_conversation_name_job(job)
+
+        mock_sleep.assert_called_once_with(0.5)
+        run.assert_called_once_with()
+        assert job.future.result(timeout=0) is None
+
+    def test_run_conversation_name_job_skips_sleep_when_already_due(self):
+        """A job that waited in the queue past its deadline runs immediately."""
+        job = message_cycle_manager_module._ConversationNameJob(
+            conversation_id="conv-1", run=Mock(), not_before=100.0, future=Future()
+        )
+
+        with (
+            patch.object(message_cycle_manager_module.time, "monotonic", return_value=105.0),
+            patch.object(message_cycle_manager_module.time, "sleep") as mock_sleep,
+        ):
+            message_cycle_manager_module._run_conversation_name_job(job)
+
+        mock_sleep.assert_not_called()
+        job.run.assert_called_once_with()
+
+    def test_run_conversation_name_job_logs_failure(self, caplog):
+        """Log errors raised by the job and record them on its future."""
+        job = message_cycle_manager_module._ConversationNameJob(
+            conversation_id="conv-1", run=Mock(side_effect=RuntimeError("db down")), not_before=0.0, future=Future()
+        )
+
+        with caplog.at_level(logging.ERROR, logger=message_cycle_manager_module.__name__):
+            message_cycle_manager_module._run_conversation_name_job(job)
+
+        assert "generate conversation name failed, conversation_id: conv-1" in caplog.text
+        assert "db down" in caplog.text
+        assert isinstance(job.future.exception(timeout=0), RuntimeError)
+
+    def test_ensure_conversation_name_workers_starts_bounded_daemon_workers(self, monkeypatch):
+        """Start up to the configured number of daemon workers and replace dead ones."""
+        dead_worker = Mock()
+        dead_worker.is_alive.return_value = False
+        workers = [dead_worker]
+        started = []
+
+        class DummyThread:
+            def __init__(self, target, name, daemon):
+                self.target = target
+                self.name = name
+                self.daemon = daemon
+
+            def start(self):
+                started.append(self)
+
+            def is_alive(self):
+                return True
+
+        monkeypatch.setattr(message_cycle_manager_module, "_conversation_name_workers", workers)
+        monkeypatch.setattr(message_cycle_manager_module, "Thread", DummyThread)
+        monkeypatch.setattr(message_cycle_manager_module.dify_config, "CONVERSATION_NAME_GENERATION_WORKERS", 2)
+
+        message_cycle_manager_module._ensure_conversation_name_workers()
+        message_cycle_manager_module._ensure_conversation_name_workers()
+
+        assert workers == started
+        assert len(started) == 2
+        assert all(worker.daemon for worker in started)
+        assert all(worker.target is message_cycle_manager_module._conversation_name_worker_loop for worker in started)
 
     def test_generate_conversation_name_worker_returns_when_conversation_missing(
         self, message_cycle_manager, cycle_db: Session
@@ -463,16 +533,19 @@ class TestMessageCycleManagerOptimization:
         assert result is None
         assert message_cycle_manager._task_state.metadata.annotation_reply is None
 
-    def test_handle_retriever_resources_merges_and_deduplicates(self, message_cycle_manager):
+    def test_handle_retriever_resources_merges_and_deduplicates(self, mock_application_generate_entity):
         """Merge retriever resources, deduplicate, and preserve ordering positions.
 
         Args: message_cycle_manager with show_retrieve_source enabled and existing metadata.
         Returns: None.
         Side effects: Updates metadata.retriever_resources with unique items and positions.
         """
-        message_cycle_manager._application_generate_entity.app_config = SimpleNamespace(
+        mock_application_generate_entity.app_config = SimpleNamespace(
             additional_features=SimpleNamespace(show_retrieve_source=True)
         )
+        message_cycle_manager = MessageCycleManager(
+            application_generate_entity=mock_application_generate_entity, task_state=Mock()
+        )
         existing = RetrievalSourceMetadata(dataset_id="d1", document_id="doc1")
         message_cycle_manager._task_state = SimpleNamespace(metadata=TaskStateMetadata(retriever_resources=[existing]))
 
@@ -493,7 +566,7 @@ class TestMessageCycleManagerOptimization:
         Returns: MessageStreamResponse with signed url and belongs_to normalized to user.
         Side effects: Calls sign_tool_file for tool file ids.
         """
-        message_cycle_manager._application_generate_entity.task_id = "task-1"
+        message_cycle_manager._task_id = "task-1"
         cycle_db.add(
             _message_file(
                 file_id="file-1",
@@ -509,27 +582,34 @@ class TestMessageCycleManagerOptimization:
 
             response = message_cycle_manager.message_file_to_stream_response(SimpleNamespace(message_file_id="file-1"))
 
+        assert response.task_id == "task-1"
         assert response.url == "signed-url"
         assert response.belongs_to == "user"
         mock_sign.assert_called_once_with(tool_file_id="file", extension=".bin")
 
-    def test_handle_retriever_resources_requires_features(self, message_cycle_manager):
+    def test_handle_retriever_resources_requires_features(self, mock_application_generate_entity):
         """Raise when retriever resources are handled without feature config.
 
         Args: message_cycle_manager with additional_features unset and empty metadata.
         Raises: ValueError when show_retrieve_source configuration is missing.
         """
-        message_cycle_manager._application_generate_entity.app_config = SimpleNamespace(additional_features=None)
+        mock_application_generate_entity.app_config = SimpleNamespace(additional_features=None)
+        message_cycle_manager = MessageCycleManager(
+            application_generate_entity=mock_application_generate_entity, task_state=Mock()
+        )
         message_cycle_manager._task_state = SimpleNamespace(metadata=TaskStateMetadata())
 
         with pytest.raises(ValueError):
             message_cycle_manager.handle_retriever_resources(QueueRetrieverResourcesEvent(retriever_resources=[]))
 
-    def test_handle_retriever_resources_skips_none_entries(self, message_cycle_manager):
+    def test_handle_retriever_resources_skips_none_entries(self, mock_application_generate_entity):
         """Ignore null resource entries while preserving valid resources."""
-        message_cycle_manager._application_generate_entity.app_config = SimpleNamespace(
+        mock_application_generate_entity.app_config = SimpleNamespace(
             additional_features=SimpleNamespace(show_retrieve_source=True)
         )
+        message_cycle_manager = MessageCycleManager(
+            application_generate_entity=mock_application_generate_entity, task_state=Mock()
+        )
         message_cycle_manager._task_state = SimpleNamespace(metadata=TaskStateMetadata(retriever_resources=[]))
         resource = RetrievalSourceMetadata(dataset_id="d1", document_id="doc1")
 
@@ -540,7 +620,7 @@ class TestMessageCycleManagerOptimization:
 
     def test_message_file_to_stream_response_uses_http_url_directly(self, message_cycle_manager, cycle_db: Session):
         """Use original URL when message file URL is already HTTP."""
-        message_cycle_manager._application_generate_entity.task_id = "task-http"
+        message_cycle_manager._task_id = "task-http"
         cycle_db.add(
             _message_file(
                 file_id="file-http",
@@ -561,7 +641,7 @@ class TestMessageCycleManagerOptimization:
         self, message_cycle_manager, cycle_db: Session
     ):
         """Default tool file extension to .bin when URL has no extension part."""
-        message_cycle_manager._application_generate_entity.task_id = "task-bin"
+        message_cycle_manager._task_id = "task-bin"
         cycle_db.add(
             _message_file(
                 file_id="file-bin",
@@ -584,6 +664,27 @@ class TestMessageCycleManagerOptimization:
         assert response.url == "signed-bin-url"
         mock_sign.assert_called_once_with(tool_file_id="tool-file-id", extension=".bin")
 
+    def test_message_file_to_stream_response_ignores_dots_outside_file_name(
+        self, message_cycle_manager, cycle_db: Session
+    ):
+        """Take the extension from the last path segment only, not from dotted directories."""
+        cycle_db.add(
+            _message_file(
+                file_id="file-dotted",
+                message_id="msg-dotted",
+                url="/files/v1.2/tool-file-id",
+                file_type=FileType.CUSTOM,
+            )
+        )
+        cycle_db.commit()
+
+        with patch("core.app.task_pipeline.message_cycle_manager.sign_tool_file") as mock_sign:
+            mock_sign.return_value = "signed-url"
+
+            message_cycle_manager.message_file_to_stream_response(SimpleNamespace(message_file_id="file-dotted"))
+
+        mock_sign.assert_called_once_with(tool_file_id="tool-file-id", extension=".bin")
+
     def test_message_file_to_stream_response_returns_none_when_file_missing(
         self, message_cycle_manager, cycle_db: Session
     ):